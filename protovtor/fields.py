@@ -2,6 +2,7 @@
 from collections import OrderedDict
 from datetime import datetime
 import copy
+import re
 
 __all__ = (
     "Field",
@@ -19,12 +20,130 @@ __all__ = (
     "ProtocolField"
 )
 
+# The max number of the datetime values cached by each datetime parser.
+DATETIME_CACHE_SIZE = 4096
+
+# The most common datetime format and a pattern that matches it exactly, used to avoid 'datetime.strptime'.
+_SIMPLE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Use '[0-9]' but not '\d', the later matches the non-ASCII digits too in Python 3, 'datetime.strptime' rejects them.
+_SIMPLE_DATETIME_PATTERN = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2}) ([0-9]{2}):([0-9]{2}):([0-9]{2})\Z")
+
+
+class _DateTimeParser(object):
+    """
+    The datetime parser of a format.
+
+    It is usually shared by all the datetime fields with the same format, the datetime values parsed will be cached,
+    because 'datetime.strptime' is very slow and the same datetime strings often come again and again.
+    """
+
+    __slots__ = ("__format", "__cache", "__match")
+
+    # The parsers created, keyed by the format.
+    _parsers = {}
+
+    def __init__(self, format):
+        """
+        :param format: str
+            The format of the datetime.
+        """
+        self.__format = format
+        self.__cache = {}
+        self.__match = _SIMPLE_DATETIME_PATTERN.match if format == _SIMPLE_DATETIME_FORMAT else None
+
+    @classmethod
+    def get(cls, format):
+        """
+        Get the shared parser of the format.
+
+        :param format: str
+            The format of the datetime.
+        :return: _DateTimeParser
+        """
+        try:
+            return cls._parsers[format]
+
+        except KeyError:
+            parser = cls._parsers[format] = cls(format)
+            return parser
+
+    def parse(self, value):
+        """
+        Parse the datetime string, the error raised by 'datetime.strptime' will not be caught.
+
+        :param value: str
+            The datetime string will be parsed to.
+        :return: datetime
+        """
+        try:
+            return self.__cache[value]
+
+        except KeyError:
+            pass
+
+        match = self.__match(value) if self.__match else None
+
+        if match:
+            # The fields are in fixed places, build the datetime directly, 'datetime' checks the ranges.
+            result = datetime(*[int(x) for x in match.groups()])
+
+        else:
+            result = datetime.strptime(value, self.__format)
+
+        # The datetime object is immutable, so it is safe to share it. Clear all when the cache is full, it is cheap
+        # and keeps the memory bounded even if all the values are unique.
+        if len(self.__cache) >= DATETIME_CACHE_SIZE:
+            self.__cache.clear()
+
+        self.__cache[value] = result
+        return result
+
+
+# Whether the field classes overwrite '__deepcopy__' only, keyed by the class.
+_deepcopy_classes = {}
+
+
+def _deepcopy_overwritten(cls):
+    """
+    Whether '__deepcopy__' is overwritten after '_clone' in the class hierarchy. The custom fields written before
+    '_clone' existed overwrite '__deepcopy__' to pass their own settings, it must be used to copy them.
+
+    :param cls: type
+        The field class.
+    :return: bool
+    """
+    try:
+        return _deepcopy_classes[cls]
+
+    except KeyError:
+        pass
+
+    result = False
+
+    for x in cls.__mro__:
+        if "_clone" in x.__dict__:
+            break
+
+        if "__deepcopy__" in x.__dict__:
+            result = True
+            break
+
+    _deepcopy_classes[cls] = result
+    return result
+
 
 class Field(object):
     """
     Base field class.
     """
 
+    __slots__ = ("default", "nullable", "discard", "value", "error")
+
+    # Whether the field instance can be reused to process and validate many values one by one. It is true only if
+    # the field keeps nothing but 'value' and 'error' while processing, then 'FieldList' needn't clone it for each
+    # value in the list. It is read from the class itself only, the child classes must set it again to be reused.
+    _reusable = False
+
     def __init__(self, default=None, nullable=False, discard=False):
         """
         :param default:
@@ -71,6 +190,29 @@ class Field(object):
         # self.error = "some errors"
         raise NotImplementedError()
 
+    def clone(self):
+        """
+        Return a new field instance with the same settings, it is much cheaper than 'copy.deepcopy'.
+
+        Because the field object is a class variable, If not do that, the field's data in all child protocol
+        classes will be shared all the life, it is wrong. If the field class overwrites '__deepcopy__' but not
+        '_clone', such as a custom field with more arguments, 'copy.deepcopy' is used in order to keep its settings.
+
+        :return: Field
+        """
+        if _deepcopy_overwritten(type(self)):
+            return copy.deepcopy(self)
+
+        return self._clone()
+
+    def _clone(self):
+        """
+        Create a new field instance with the same settings. The child class with more settings should overwrite it.
+
+        :return: Field
+        """
+        raise NotImplementedError()
+
     def __deepcopy__(self, *args, **kwargs):
         """
         Return a new field instance.
@@ -88,12 +230,15 @@ class BaseField(Field):
     More useful base field class.
     """
 
+    __slots__ = ("_validators",)
+
     def __init__(self, validators=(), *args, **kwargs):
         """
         :param validators: list
             Validators chain, will be called sequentially.
         """
-        self._validators = validators
+        # Keep them in a tuple, it is shared by all the cloned fields and never changed.
+        self._validators = tuple(validators)
 
         super(BaseField, self).__init__(*args, **kwargs)
 
@@ -101,9 +246,16 @@ class BaseField(Field):
         raise NotImplementedError()
 
     def validate(self):
+        # Most of the fields have no validators.
+        if not self._validators:
+            return True
+
+        # The value may be a property, so read it once only.
+        value = self.value
+
         try:
             for x in self._validators:
-                x.validate(self.value)
+                x.validate(value)
 
         except ValueError as e:
             # To tell higher level the field has an error.
@@ -116,7 +268,7 @@ class BaseField(Field):
 
         return True
 
-    def __deepcopy__(self, *args, **kwargs):
+    def _clone(self):
         # Copy a new field instance.
         return self.__class__(
             validators=self._validators,
@@ -125,15 +277,25 @@ class BaseField(Field):
             discard=self.discard
         )
 
+    def __copy__(self):
+        return self.clone()
+
+    def __deepcopy__(self, *args, **kwargs):
+        return self._clone()
+
 
 class StringField(BaseField):
     """
     You should process and validate string value with this field. The method 'strip' will be called.
     """
 
+    __slots__ = ()
+
+    _reusable = True
+
     def process(self, value):
         try:
-            self.value = str(value).strip()
+            self.value = (value if type(value) is str else str(value)).strip()
 
         except Exception:
             self.error = "Not a valid str value"
@@ -148,12 +310,20 @@ class TextField(StringField):
     and "\r\n" will be replaced to "\n" in this time.
     """
 
+    __slots__ = ()
+
+    _reusable = True
+
     def process(self, value):
-        if super(TextField, self).process(value):
-            self.value = self.value.replace("\r\n", "\n")
-            return True
+        # The same as 'StringField', but do all in one step.
+        try:
+            self.value = (value if type(value) is str else str(value)).strip().replace("\r\n", "\n")
 
-        return False
+        except Exception:
+            self.error = "Not a valid str value"
+            return False
+
+        return True
 
 
 class LengthLimitTextField(TextField):
@@ -163,6 +333,10 @@ class LengthLimitTextField(TextField):
     "\n" in this time.
     """
 
+    __slots__ = ("__limit",)
+
+    _reusable = True
+
     def __init__(self, limit, *args, **kwargs):
         """
         :param limit: int
@@ -173,16 +347,29 @@ class LengthLimitTextField(TextField):
         super(LengthLimitTextField, self).__init__(*args, **kwargs)
 
     def process(self, value):
-        if super(LengthLimitTextField, self).process(value):
-            # Cut.
-            if len(self.value) > self.__limit:
-                self.value = self.value[0:self.__limit]
+        # The same as 'TextField', but do all in one step.
+        try:
+            value = (value if type(value) is str else str(value)).strip()
 
-            return True
+        except Exception:
+            self.error = "Not a valid str value"
+            return False
 
-        return False
+        # Each "\r\n" becomes one char, so the first 'limit * 2' chars are enough to fill the limit after replaced,
+        # cut the long string first to replace less chars.
+        if 0 <= self.__limit * 2 < len(value):
+            value = value[0:self.__limit * 2]
 
-    def __deepcopy__(self, *args, **kwargs):
+        value = value.replace("\r\n", "\n")
+
+        # Cut.
+        if len(value) > self.__limit:
+            value = value[0:self.__limit]
+
+        self.value = value
+        return True
+
+    def _clone(self):
         return self.__class__(
             self.__limit,
             validators=self._validators,
@@ -197,11 +384,20 @@ class IntegerField(BaseField):
     You should process and validate int value with this field.
     """
 
+    __slots__ = ()
+
+    _reusable = True
+
     def process(self, value):
+        # Most of the values are int already, needn't convert them.
+        if type(value) is int:
+            self.value = value
+            return True
+
         try:
             self.value = int(value)
 
-        except Exception:
+        except (TypeError, ValueError, OverflowError):
             self.error = "Not a valid int value"
             return False
 
@@ -213,10 +409,14 @@ class FloatField(BaseField):
     You should process and validate float value with this field.
     """
 
+    __slots__ = ("__precision",)
+
+    _reusable = True
+
     def __init__(self, precision=2, *args, **kwargs):
         """
         :param precision: int
-            The precision of the float value.
+            The precision of the float value, the value will not be rounded if it is 'None'.
         """
         self.__precision = precision
 
@@ -224,15 +424,19 @@ class FloatField(BaseField):
 
     def process(self, value):
         try:
-            self.value = round(float(value), self.__precision)
+            # Most of the values are float already, needn't convert them.
+            if type(value) is not float:
+                value = float(value)
 
-        except Exception:
+            self.value = value if self.__precision is None else round(value, self.__precision)
+
+        except (TypeError, ValueError, OverflowError):
             self.error = "Not a valid float value"
             return False
 
         return True
 
-    def __deepcopy__(self, *args, **kwargs):
+    def _clone(self):
         return self.__class__(
             precision=self.__precision,
             validators=self._validators,
@@ -247,11 +451,15 @@ class BooleanField(BaseField):
     You should process and validate bool value with this field.
     """
 
+    __slots__ = ()
+
+    _reusable = True
+
     def process(self, value):
         try:
             self.value = bool(value)
 
-        except Exception:
+        except (TypeError, ValueError):
             self.error = "Not a valid bool value"
             return False
 
@@ -263,18 +471,23 @@ class DateTimeField(BaseField):
     You should process and validate datetime value with this field.
     """
 
+    __slots__ = ("__format", "__parse")
+
+    _reusable = True
+
     def __init__(self, format="%Y-%m-%d %H:%M:%S", *args, **kwargs):
         """
         :param format: str
             The format of the datetime.
         """
         self.__format = format
+        self.__parse = _DateTimeParser.get(format).parse
 
         super(DateTimeField, self).__init__(*args, **kwargs)
 
     def process(self, value):
         try:
-            self.value = datetime.strptime(value, self.__format)
+            self.value = self.__parse(value)
 
         except Exception:
             self.error = "Not a valid datetime value"
@@ -282,6 +495,15 @@ class DateTimeField(BaseField):
 
         return True
 
+    def _clone(self):
+        return self.__class__(
+            format=self.__format,
+            validators=self._validators,
+            default=self.default,
+            nullable=self.nullable,
+            discard=self.discard
+        )
+
 
 class PlaceField(BaseField):
     """
@@ -289,6 +511,8 @@ class PlaceField(BaseField):
     should use this field.
     """
 
+    __slots__ = ("__field", "__handler", "__value")
+
     def __init__(self, field=None, handler=None, *args, **kwargs):
         """
         :param field: Field
@@ -334,9 +558,9 @@ class PlaceField(BaseField):
 
         return super(PlaceField, self).validate()
 
-    def __deepcopy__(self, *args, **kwargs):
+    def _clone(self):
         return self.__class__(
-            field=copy.deepcopy(self.__field),
+            field=self.__field.clone() if self.__field else None,
             handler=self.__handler,
             validators=self._validators,
             default=self.default,
@@ -358,6 +582,8 @@ class FieldList(BaseField):
     You should process and validate list-like value with this field.
     """
 
+    __slots__ = ("__entries", "__field", "__reusable", "__value")
+
     def __init__(self, field, *args, **kwargs):
         """
         :param field: Field
@@ -366,6 +592,9 @@ class FieldList(BaseField):
         self.__entries = []
         self.__field = field
 
+        # The entries are the values processed if the field is reusable, otherwise they are the field instances.
+        self.__reusable = type(field).__dict__.get("_reusable", False)
+
         super(FieldList, self).__init__(*args, **kwargs)
 
         # Put here is because of the 'self.value' has been covered by super.
@@ -376,9 +605,35 @@ class FieldList(BaseField):
             self.error = "Not a valid list value"
             return False
 
+        if self.__reusable:
+            field = self.__field
+
+            # The values of a pure int field can be converted all in one call, the loop below is only needed to
+            # find out the wrong value.
+            if type(field) is IntegerField:
+                try:
+                    self.__entries.extend(list(map(int, value)))
+                    return True
+
+                except (TypeError, ValueError, OverflowError):
+                    pass
+
+            # Bind the methods to local variables, it is called for each value.
+            process = field.process
+            append = self.__entries.append
+
+            for x, y in enumerate(value):
+                if not process(y):
+                    self.error = [x, field.error]
+                    return False
+
+                append(field.value)
+
+            return True
+
         for x, y in enumerate(value):
             # If not, there will be a share data problem.
-            field_new = copy.deepcopy(self.__field)
+            field_new = self.__field.clone()
 
             if not field_new.process(y):
                 self.error = [x, field_new.error]
@@ -389,17 +644,31 @@ class FieldList(BaseField):
         return True
 
     def validate(self):
-        for x, y in enumerate(self.__entries):
-            if not y.validate():
-                self.error = [x, y.error]
+        if self.__reusable:
+            # Bind the method to a local variable, it is called for each value.
+            field = self.__field
+            validate = field.validate
 
-                return False
+            for x, y in enumerate(self.__entries):
+                field.value = y
+
+                if not validate():
+                    self.error = [x, field.error]
+
+                    return False
+
+        else:
+            for x, y in enumerate(self.__entries):
+                if not y.validate():
+                    self.error = [x, y.error]
+
+                    return False
 
         return super(FieldList, self).validate()
 
-    def __deepcopy__(self, *args, **kwargs):
+    def _clone(self):
         return self.__class__(
-            field=copy.deepcopy(self.__field),
+            field=self.__field.clone(),
             validators=self._validators,
             default=self.default,
             nullable=self.nullable,
@@ -408,7 +677,10 @@ class FieldList(BaseField):
 
     @property
     def value(self):
-        return list(x.value for x in self.__entries) if self.__entries else self.__value
+        if not self.__entries:
+            return self.__value
+
+        return list(self.__entries) if self.__reusable else list(x.value for x in self.__entries)
 
     @value.setter
     def value(self, value):
@@ -421,22 +693,22 @@ class UniqueFieldList(FieldList):
     will be removed, and it can not ensure the sequence.
     """
 
+    __slots__ = ()
+
     def process(self, value):
         if not isinstance(value, (tuple, list)):
             self.error = "Not a valid list value"
             return False
 
-        # Keep the sequence.
-        d = OrderedDict()
+        # Keep the sequence, 'fromkeys' removes the repeat values in one pass.
         try:
-            for x in value:
-                d[x] = True
+            value = tuple(OrderedDict.fromkeys(value))
 
         except TypeError:
             self.error = "Not a valid one-dimensional list value"
             return False
 
-        return super(UniqueFieldList, self).process(tuple(d.keys()))
+        return super(UniqueFieldList, self).process(value)
 
 
 class ProtocolField(Field):
@@ -444,6 +716,8 @@ class ProtocolField(Field):
     You should process and validate dict value with this field.
     """
 
+    __slots__ = ("__protoclass", "__protocol", "__error", "__value")
+
     def __init__(self, protoclass, *args, **kwargs):
         """
         :param protoclass: Protocol
@@ -459,6 +733,11 @@ class ProtocolField(Field):
         self.__value = {}
 
     def process(self, value):
+        # Check the type here, it is much cheaper than raising and catching the error.
+        if not isinstance(value, dict):
+            self.__error = "Not a valid dict value"
+            return False
+
         try:
             self.__protocol = self.__protoclass(value)
 
@@ -471,14 +750,20 @@ class ProtocolField(Field):
     def validate(self):
         return self.__protocol.validate()
 
-    def __deepcopy__(self, *args, **kwargs):
+    def _clone(self):
         return self.__class__(
-            protoclass=copy.deepcopy(self.__protoclass),
+            protoclass=self.__protoclass,
             default=self.default,
             nullable=self.nullable,
             discard=self.discard
         )
 
+    def __copy__(self):
+        return self.clone()
+
+    def __deepcopy__(self, *args, **kwargs):
+        return self._clone()
+
     @property
     def value(self):
         return self.__protocol.data if self.__protocol else self.__value
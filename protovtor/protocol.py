@@ -1,11 +1,81 @@
 # coding: utf-8
 from protovtor.fields import Field
-import copy
+import abc
+
+try:
+    from sys import intern
+except ImportError:
+    # It is a built-in function in Python 2.
+    pass
 
 __all__ = ("Protocol",)
 
+# The default prefix of the fields.
+DEFAULT_PREFIX = "field_"
+
+
+def _is_overwritten(cls, name):
+    """
+    Whether the method of the base protocol class is overwritten. The base one does nothing, so it needn't be called.
+
+    :param cls: ProtocolMeta
+        The protocol class.
+    :param name: str
+        The method name.
+    :return: bool
+    """
+    return len([x for x in cls.__mro__ if name in x.__dict__]) > 1
+
 
-class Protocol(object):
+def _reset_cache(cls):
+    """
+    Reset the cache of the protocol class and its child classes.
+
+    :param cls: ProtocolMeta
+        The protocol class will be reset.
+    """
+    # Don't call the '__setattr__' of the meta class, it will reset again.
+    type.__setattr__(cls, "_field_cache", {})
+    type.__setattr__(cls, "_has_post_data", _is_overwritten(cls, "post_data"))
+    type.__setattr__(cls, "_has_post_validate", _is_overwritten(cls, "post_validate"))
+
+    # Find the fields with the default prefix now, most of the protocol classes use it, so the first instantiation
+    # needn't do that. The base class created by the meta class directly has no this method.
+    if hasattr(cls, "_field_templates"):
+        cls._field_templates(DEFAULT_PREFIX)
+
+    for x in cls.__subclasses__():
+        _reset_cache(x)
+
+
+class ProtocolMeta(abc.ABCMeta):
+    """
+    Protocol meta class. It is derived from 'abc.ABCMeta', so the protocol classes can still be mixed with the
+    abstract base classes.
+
+    The field objects of a protocol class will be found once and cached in the class, so the class variables are not
+    scanned at every instantiation. The hooks 'post_data' and 'post_validate' will be called only if they are
+    overwritten. The cache will be reset if the class or its parent classes are changed.
+    """
+
+    def __init__(cls, name, bases, attrs):
+        super(ProtocolMeta, cls).__init__(name, bases, attrs)
+
+        _reset_cache(cls)
+
+    def __setattr__(cls, name, value):
+        super(ProtocolMeta, cls).__setattr__(name, value)
+
+        _reset_cache(cls)
+
+    def __delattr__(cls, name):
+        super(ProtocolMeta, cls).__delattr__(name)
+
+        _reset_cache(cls)
+
+
+# Create the base class by calling the meta class, it works in both Python 2 and Python 3.
+class Protocol(ProtocolMeta("ProtocolBase", (object,), {"__slots__": ()})):
     """
     Base protocol class.
 
@@ -16,7 +86,9 @@ class Protocol(object):
     the valid data will be returned, if there are some errors, you will receive a detailed error message.
     """
 
-    def __init__(self, data, prefix="field_"):
+    __slots__ = ("__fields", "__templates", "_valid_fields", "_discard_fields", "_error_fields", "_uncheck_fields")
+
+    def __init__(self, data, prefix=DEFAULT_PREFIX):
         """
         :param data: dict
             The data will be converted and validated to, it must be a dict data.
@@ -39,21 +111,85 @@ class Protocol(object):
         # The field instances validated wrong.
         self._error_fields = {}
 
-        # Find field objects all.
-        for name in dir(self):
-            attr = getattr(self, name)
+        # The field names and instances processed successfully but not validated yet.
+        self._uncheck_fields = []
 
-            if name.startswith(prefix) and isinstance(attr, Field):
-                # Remove the field prefix.
-                name = name[len(prefix):]
+        templates = self._field_templates(prefix)
+
+        # The fields may be set on the instance by the child class before calling this method, they are not cached.
+        instance_attrs = getattr(self, "__dict__", None)
+        if instance_attrs:
+            templates = self._instance_field_templates(templates, instance_attrs, prefix)
 
-                # Copy a new field instance, because the field object is a class variable, if not do that, all child
-                # classes data will be shared, it is wrong.
-                self.__fields[name] = copy.deepcopy(attr)
+        self.__templates = templates
+
+        for name, field in self.__templates:
+            # Copy a new field instance, because the field object is a class variable, if not do that, all child
+            # classes data will be shared, it is wrong.
+            self.__fields[name] = field.clone()
 
         # Process the data.
         self.process(data)
 
+    @classmethod
+    def _field_templates(cls, prefix):
+        """
+        Get the field objects of the protocol class, they are found once and cached in the class.
+
+        :param prefix: str
+            The prefix of the fields.
+        :return: tuple
+            The pairs of the field name without the prefix and the field object.
+        """
+        try:
+            return cls._field_cache[prefix]
+
+        except KeyError:
+            pass
+
+        templates = []
+
+        # Find field objects all.
+        for name in dir(cls):
+            if not name.startswith(prefix):
+                continue
+
+            attr = getattr(cls, name)
+
+            if isinstance(attr, Field):
+                # Remove the field prefix, and intern the name to make the lookups in data faster.
+                templates.append((intern(name[len(prefix):]), attr))
+
+        templates = cls._field_cache[prefix] = tuple(templates)
+        return templates
+
+    @staticmethod
+    def _instance_field_templates(templates, attrs, prefix):
+        """
+        Merge the field objects set on the instance into the ones of the class, the former take precedence.
+
+        :param templates: tuple
+            The field templates of the class.
+        :param attrs: dict
+            The instance attributes.
+        :param prefix: str
+            The prefix of the fields.
+        :return: tuple
+            The pairs of the field name without the prefix and the field object, sorted by the name.
+        """
+        fields = dict(templates)
+        found = False
+
+        for name, attr in attrs.items():
+            if name.startswith(prefix) and isinstance(attr, Field):
+                fields[intern(name[len(prefix):])] = attr
+                found = True
+
+        if not found:
+            return templates
+
+        return tuple(sorted(fields.items(), key=lambda x: x[0]))
+
     def process(self, data):
         """
         The values in data will be processed in this method, such as type conversion or something other defined in
@@ -62,37 +198,50 @@ class Protocol(object):
         :param data: dict
             The data will be processed to.
         """
-        for name, field in self.__fields.items():
+        # Bind the containers to local variables, the loop is the hottest path of the protocol.
+        fields = self.__fields
+        valid_fields = self._valid_fields
+        discard_fields = self._discard_fields
+        error_fields = self._error_fields
+        uncheck_fields = self._uncheck_fields
+        get = data.get
+
+        for name, _ in self.__templates:
+            field = fields[name]
+            value = get(name)
+
             # It mean the value you expect not in the data or is none, btw, if a value is nullable, it can be set
             # none or not be set in the data.
-            if data.get(name) is None:
-                # If you don't like to get none values, you can discard them, the none values will be removed in
-                # the result set.
-                if field.nullable and field.discard:
-                    self._discard_fields.append(name)
-                    continue
-
-                # If you don't mind to get none values, you can keep them, the none values will be kept in the
-                # result set.
-                if field.nullable and not field.discard:
+            if value is None:
+                if field.nullable:
+                    # If you don't like to get none values, you can discard them, the none values will be removed
+                    # in the result set.
+                    if field.discard:
+                        discard_fields.append(name)
+                        continue
+
+                    # If you don't mind to get none values, you can keep them, the none values will be kept in the
+                    # result set.
                     field.value = None
-                    self._valid_fields[name] = field
+                    valid_fields[name] = field
                     continue
 
                 # You can set a default value for the field.
-                if not field.nullable and field.default is not None:
-                    data[name] = field.default
+                if field.default is not None:
+                    data[name] = value = field.default
 
                 else:
                     field.error = "The field is required"
-                    self._error_fields[name] = field
+                    error_fields[name] = field
                     break
 
             # Process the field's value.
-            if not field.process(data[name]):
-                self._error_fields[name] = field
+            if not field.process(value):
+                error_fields[name] = field
                 break
 
+            uncheck_fields.append((name, field))
+
     def post_data(self, data):
         """
         You can overwrite this method in order to do something you like with the result data. The method will be
@@ -115,21 +264,21 @@ class Protocol(object):
         if self._error_fields:
             return False
 
-        # Find all the unverified fields.
-        uncheck_fields = {k: v for k, v in self.__fields.items() if
-                          k not in self._valid_fields and k not in self._discard_fields}
+        uncheck_fields = self._uncheck_fields
+        valid_fields = self._valid_fields
 
-        # Validate the field's value.
-        for name, field in uncheck_fields.items():
+        # Validate the field's value, the unverified fields have been found in 'process'.
+        for name, field in uncheck_fields:
             if not field.validate():
                 self._error_fields[name] = field
                 return False
 
-        self._valid_fields.update(uncheck_fields)
+        valid_fields.update(uncheck_fields)
+        self._uncheck_fields = []
 
         # Call the 'post_validate' method and get the error fields.
-        if not self.post_validate(self._valid_fields):
-            for name, field in self._valid_fields.items():
+        if self._has_post_validate and not self.post_validate(valid_fields):
+            for name, field in valid_fields.items():
                 if hasattr(field, "error") and field.error:
                     self._error_fields[name] = field
 
@@ -159,7 +308,7 @@ class Protocol(object):
             return {}
 
         pre_data = {name: field.value for name, field in self._valid_fields.items()}
-        return self.post_data(pre_data)
+        return self.post_data(pre_data) if self._has_post_data else pre_data
 
     @property
     def error(self):
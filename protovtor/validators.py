@@ -1,5 +1,7 @@
 # coding: utf-8
 from protovtor.protocol import Protocol
+import weakref
+import abc
 import sys
 import re
 
@@ -17,12 +19,111 @@ __all__ = (
     "DataRequired"
 )
 
+# The text type, 'unicode' in Python 2 and 'str' in Python 3.
+_text_type = type(u"")
 
-class Validator(object):
+# Whether the text is all ASCII, 'str.isascii' is new in Python 3.7 and it is a quick check in C.
+_is_ascii = getattr(_text_type, "isascii", lambda value: False)
+
+
+def _utf8_size(value):
+    """
+    Get the bytes size of the text in UTF-8. The lone surrogates, such as the ones decoded by 'json.loads', can not
+    be encoded strictly, they are counted as 3 bytes each, the same as Python 2 encodes them.
+
+    :param value: str
+        The text.
+    :return: int
+    """
+    try:
+        return len(value.encode("utf-8"))
+
+    except UnicodeEncodeError:
+        return len(value.encode("utf-8", "surrogatepass"))
+
+
+# The max number of the patterns cached.
+PATTERN_CACHE_SIZE = 256
+
+# The compiled patterns, keyed by the pattern and the flags.
+_pattern_cache = {}
+
+
+def _compile(pattern, flags=0):
+    """
+    Compile the pattern with a bounded cache, the same patterns are usually compiled again and again when the
+    validators are created.
+
+    :param pattern: str
+        The pattern of the regular.
+    :param flags: int
+        The flags of the regular.
+    :return: Pattern
+    """
+    key = (pattern, flags)
+
+    try:
+        return _pattern_cache[key]
+
+    except KeyError:
+        pass
+
+    result = re.compile(pattern, flags)
+
+    # Clear all when the cache is full, it is cheap and keeps the memory bounded.
+    if len(_pattern_cache) >= PATTERN_CACHE_SIZE:
+        _pattern_cache.clear()
+
+    _pattern_cache[key] = result
+    return result
+
+
+# The built-in validator instances alive, keyed by the class and the arguments.
+_validator_cache = weakref.WeakValueDictionary()
+
+
+class ValidatorMeta(abc.ABCMeta):
+    """
+    Validator meta class. It is derived from 'abc.ABCMeta', so the validator classes can still be mixed with the
+    abstract base classes.
+
+    The built-in validators keep nothing but the settings, so the ones created with the same arguments will be
+    shared, the same validators are usually declared in many fields. The validators defined out of this module are
+    created as usual.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        if cls.__module__ != __name__:
+            return super(ValidatorMeta, cls).__call__(*args, **kwargs)
+
+        kwargs_items = tuple(sorted(kwargs.items()))
+
+        # The 'repr' tells the equal values of different types apart, such as '1' and 'True'.
+        key = (cls, args, kwargs_items, repr(args), repr(kwargs_items))
+
+        try:
+            validator = _validator_cache.get(key)
+
+        except TypeError:
+            # Some arguments are unhashable.
+            return super(ValidatorMeta, cls).__call__(*args, **kwargs)
+
+        if validator is None:
+            validator = super(ValidatorMeta, cls).__call__(*args, **kwargs)
+            _validator_cache[key] = validator
+
+        return validator
+
+
+# Create the base class by calling the meta class, it works in both Python 2 and Python 3.
+class Validator(ValidatorMeta("ValidatorBase", (object,), {"__slots__": ()})):
     """
     Base validator class.
     """
 
+    # The '__weakref__' is needed by the shared validators.
+    __slots__ = ("__weakref__",)
+
     def validate(self, value):
         """
         Validate the value here.
@@ -40,6 +141,8 @@ class Length(Validator):
     You should validate string value with this validator.
     """
 
+    __slots__ = ("_min", "_max")
+
     def __init__(self, min=-1, max=-1):
         """
         :param min: int
@@ -80,9 +183,12 @@ class Length(Validator):
 
 class ByteSize(Validator):
     """
-    You should validate value bytes size with this validator.
+    You should validate value bytes size with this validator. The size of a bytes value is its length, the size of
+    a text value is the length of its UTF-8 encoding, the size of others is the size of the object in memory.
     """
 
+    __slots__ = ("_max",)
+
     def __init__(self, max):
         """
         :param max: int
@@ -97,7 +203,18 @@ class ByteSize(Validator):
         self._max = max
 
     def validate(self, value):
-        value_size = sys.getsizeof(value)
+        if isinstance(value, (bytes, bytearray)):
+            value_size = len(value)
+
+        elif isinstance(value, _text_type):
+            value_size = len(value)
+
+            # Each char takes 1 to 4 bytes in UTF-8, encode the value only if the length can't tell the result.
+            if value_size <= self._max < value_size * 4 and not _is_ascii(value):
+                value_size = _utf8_size(value)
+
+        else:
+            value_size = sys.getsizeof(value)
 
         if value_size > self._max:
             raise ValueError("Can not greater then {0} bytes size".format(self._max))
@@ -108,6 +225,8 @@ class NumberRange(Length):
     You should validate number value interval with this validator.
     """
 
+    __slots__ = ()
+
     def validate(self, value):
         if self._min == -1:
             if value > self._max:
@@ -127,16 +246,21 @@ class Regular(Validator):
     You should validate string value with this validator.
     """
 
-    def __init__(self, pattern):
+    __slots__ = ("_pattern", "_compile_pattern", "_match")
+
+    def __init__(self, pattern, flags=0):
         """
         :param pattern: str
             The pattern of the regular.
+        :param flags: int
+            The flags of the regular, such as 're.IGNORECASE'.
         """
         self._pattern = pattern
-        self._compile_pattern = re.compile(pattern)
+        self._compile_pattern = _compile(pattern, flags)
+        self._match = self._compile_pattern.match
 
     def validate(self, value):
-        if not self._compile_pattern.match(value):
+        if not self._match(value):
             raise ValueError("Not match the pattern: {0}".format(self._pattern))
 
 
@@ -145,6 +269,8 @@ class AnyOf(Validator):
     You should validate a value that must be one of the values you define.
     """
 
+    __slots__ = ("_values", "_value_set")
+
     def __init__(self, values):
         """
         :param values: list
@@ -155,8 +281,22 @@ class AnyOf(Validator):
 
         self._values = values
 
+        # Find the value by hash if all the values are hashable.
+        try:
+            self._value_set = frozenset(values)
+
+        except TypeError:
+            self._value_set = values
+
     def validate(self, value):
-        if value not in self._values:
+        try:
+            found = value in self._value_set
+
+        except TypeError:
+            # The value is unhashable.
+            found = value in self._values
+
+        if not found:
             raise ValueError("Must be one of {0}".format(self._values))
 
 
@@ -165,8 +305,17 @@ class NoneOf(AnyOf):
     You should validate a value that must not be one of the values you define.
     """
 
+    __slots__ = ()
+
     def validate(self, value):
-        if value in self._values:
+        try:
+            found = value in self._value_set
+
+        except TypeError:
+            # The value is unhashable.
+            found = value in self._values
+
+        if found:
             raise ValueError("Can not be one of {0}".format(self._values))
 
 
@@ -175,6 +324,8 @@ class InstanceOf(AnyOf):
     You should validate a value's type that must be one of the values you define.
     """
 
+    __slots__ = ("_types",)
+
     def __init__(self, *args, **kwargs):
         super(InstanceOf, self).__init__(*args, **kwargs)
 
@@ -182,8 +333,10 @@ class InstanceOf(AnyOf):
             if not isinstance(x, type):
                 raise RuntimeError("Each value must be a type type")
 
+        self._types = tuple(self._values)
+
     def validate(self, value):
-        if not isinstance(value, tuple(self._values)):
+        if not isinstance(value, self._types):
             raise ValueError("Must be instance of {0}".format(self._values))
 
 
@@ -192,6 +345,8 @@ class KeyRequired(Validator):
     You should validate dict value with this validator. The keys in value must be all existed.
     """
 
+    __slots__ = ("_values", "_value_set")
+
     def __init__(self, values):
         """
         :param values: list
@@ -202,7 +357,19 @@ class KeyRequired(Validator):
 
         self._values = values
 
+        # Find the missing keys by a set operation if all the keys are hashable.
+        try:
+            self._value_set = frozenset(values)
+
+        except TypeError:
+            self._value_set = None
+
     def validate(self, value):
+        # The difference with a dict is done in C, it is the common case. Nothing is missing mostly.
+        if self._value_set is not None and type(value) is dict and not self._value_set.difference(value):
+            return
+
+        # Find the first missing key in order.
         for key in self._values:
             if key not in value:
                 raise ValueError("Must has key: {0}".format(key))
@@ -214,6 +381,8 @@ class ProtoRequired(Validator):
     protocol class you set.
     """
 
+    __slots__ = ("_protoclass",)
+
     def __init__(self, protoclass):
         """
         :param protoclass:
@@ -236,6 +405,8 @@ class DataRequired(Validator):
     You should validate a value that must not be a zero value.
     """
 
+    __slots__ = ()
+
     def validate(self, value):
         if not value:
             raise ValueError("The value is required")
@@ -1,7 +1,11 @@
 # coding: utf-8
 from protovtor import *
 from protovtor.validators import *
+from datetime import datetime
+import abc
 import unittest
+import copy
+import re
 
 
 class TestProtocol(unittest.TestCase):
@@ -16,6 +20,50 @@ class TestProtocol(unittest.TestCase):
         self.assertTrue(p.validate())
         self.assertEqual(p.data, None)
 
+        class ChildProto(Proto):
+            def post_data(self, data):
+                return data
+
+        # The fields cached should be reset if the parent class is changed.
+        self.assertEqual(ChildProto._field_templates("field_")[0][0], "name")
+        Proto.field_age = IntegerField()
+
+        p = ChildProto(dict(name="konglw", age="18"))
+        self.assertTrue(p.validate())
+        self.assertEqual(p.data, dict(name="konglw", age=18))
+
+        # The settings of the field objects can be changed at any time.
+        Proto.field_age.nullable = True
+
+        p = ChildProto(dict(name="konglw"))
+        self.assertTrue(p.validate())
+        self.assertEqual(p.data, dict(name="konglw", age=None))
+
+    def test_Protocol_abc(self):
+        # The same as 'abc.ABC', which is not in Python 2.
+        AbstractBase = abc.ABCMeta("AbstractBase", (object,), {})
+
+        class Proto(Protocol, AbstractBase):
+            field_name = StringField()
+
+        p = Proto(dict(name="konglw"))
+        self.assertTrue(p.validate())
+        self.assertEqual(p.data, dict(name="konglw"))
+
+    def test_Protocol_instance_field(self):
+        class Proto(Protocol):
+            field_name = StringField()
+
+            def __init__(self, data):
+                # The fields set on the instance are found too.
+                self.field_z = StringField()
+
+                super(Proto, self).__init__(data)
+
+        p = Proto(dict(name="konglw", z="1"))
+        self.assertTrue(p.validate())
+        self.assertEqual(p.data, dict(name="konglw", z="1"))
+
 
 class TestField(unittest.TestCase):
     def test_StringField(self):
@@ -39,6 +87,17 @@ class TestField(unittest.TestCase):
         self.assertTrue(f.validate())
         self.assertTrue(len(f.value) == 1)
 
+        # The "\r\n" crosses the place where the long string is cut first.
+        f = LengthLimitTextField(limit=2)
+
+        self.assertTrue(f.process("a\r\n\r\nb"))
+        self.assertEqual(f.value, "a\n")
+
+        f = LengthLimitTextField(limit=3)
+
+        self.assertTrue(f.process("a\r\n\r\nb"))
+        self.assertEqual(f.value, "a\n\n")
+
     def test_IntegerField(self):
         f = IntegerField()
 
@@ -53,6 +112,11 @@ class TestField(unittest.TestCase):
         self.assertTrue(f.validate())
         self.assertTrue(f.value == 1.1)
 
+        f = FloatField(precision="a")
+
+        self.assertFalse(f.process("1.2"))
+        self.assertEqual(f.error, "Not a valid float value")
+
     def test_BooleanField(self):
         f = BooleanField()
 
@@ -67,6 +131,23 @@ class TestField(unittest.TestCase):
         self.assertTrue(f.validate())
         self.assertTrue(f.value)
 
+        self.assertTrue(f.process("2018-05-21 13:47:14"))
+        self.assertEqual(f.value, datetime(2018, 5, 21, 13, 47, 14))
+
+        # The value not padded is parsed by 'datetime.strptime'.
+        self.assertTrue(f.process("2018-5-21 1:2:3"))
+        self.assertEqual(f.value, datetime(2018, 5, 21, 1, 2, 3))
+
+        self.assertFalse(f.process("2018-02-30 00:00:00"))
+        self.assertFalse(f.process(u"\uff12\uff10\uff11\uff18-\uff10\uff15-\uff12\uff11 \uff11\uff13:\uff14\uff17:\uff11\uff13"))
+        self.assertFalse(f.process(u"\u0662\u0660\u0661\u0668-\u0660\u0665-\u0662\u0661 \u0661\u0663:\u0664\u0667:\u0661\u0663"))
+
+        f = DateTimeField(format="%Y/%m/%d").clone()
+
+        self.assertTrue(f.process("2018/05/21"))
+        self.assertTrue(f.validate())
+        self.assertTrue(f.value)
+
     def test_PlaceField(self):
         f = PlaceField(handler=lambda x: int(x))
 
@@ -81,6 +162,38 @@ class TestField(unittest.TestCase):
         self.assertTrue(f.validate())
         self.assertTrue(f.value == [1, 2, 3])
 
+        # The wrong value is found out after the values failed to be converted all in one call.
+        f = FieldList(IntegerField())
+
+        self.assertFalse(f.process(["1", "x", "3"]))
+        self.assertEqual(f.error[0], 1)
+
+        f = FieldList(IntegerField(validators=[NumberRange(max=2)]))
+
+        self.assertTrue(f.process(["1", "2", "3"]))
+        self.assertFalse(f.validate())
+        self.assertEqual(f.error[0], 2)
+
+        class TagStringField(StringField):
+            def process(self, value):
+                self.tag = value
+
+                return super(TagStringField, self).process(value)
+
+            def validate(self):
+                if self.tag != self.value:
+                    self.error = "untrimmed"
+                    return False
+
+                return True
+
+        # The child classes of the simple fields are not reused unless they say so.
+        f = FieldList(TagStringField())
+
+        self.assertTrue(f.process(["a", " b"]))
+        self.assertFalse(f.validate())
+        self.assertEqual(f.error, [1, "untrimmed"])
+
     def test_UniqueFieldList(self):
         f = UniqueFieldList(IntegerField())
 
@@ -90,6 +203,36 @@ class TestField(unittest.TestCase):
 
         self.assertFalse(f.process(1))
 
+    def test_CustomField(self):
+        class PrefixStringField(StringField):
+            def __init__(self, prefix, *args, **kwargs):
+                self.prefix = prefix
+
+                super(PrefixStringField, self).__init__(*args, **kwargs)
+
+            def process(self, value):
+                if super(PrefixStringField, self).process(value):
+                    self.value = self.prefix + self.value
+                    return True
+
+                return False
+
+            def __deepcopy__(self, *args, **kwargs):
+                return self.__class__(self.prefix, validators=self._validators)
+
+        class Proto(Protocol):
+            field_a = PrefixStringField("#")
+            field_b = FieldList(PrefixStringField("$"))
+
+        p = Proto(dict(a="1", b=["2", "3"]))
+        self.assertTrue(p.validate())
+        self.assertEqual(p.data, dict(a="#1", b=["$2", "$3"]))
+
+        f = copy.copy(PrefixStringField("#"))
+
+        self.assertTrue(f.process("1"))
+        self.assertEqual(f.value, "#1")
+
     def test_ProtocolField(self):
         class Proto(Protocol):
             field_name = StringField()
@@ -102,15 +245,50 @@ class TestField(unittest.TestCase):
 
 
 class TestValidator(unittest.TestCase):
+    def test_Validator(self):
+        AbstractBase = abc.ABCMeta("AbstractBase", (object,), {})
+
+        class UpperRequired(Validator, AbstractBase):
+            def validate(self, value):
+                if not value.isupper():
+                    raise ValueError("The value is not upper")
+
+        with self.assertRaises(ValueError):
+            UpperRequired().validate("test")
+
     def test_Length(self):
         with self.assertRaises(ValueError):
             v = Length(min=5, max=5)
             v.validate("test")
 
+        # The built-in validators with the same arguments are shared.
+        self.assertIs(Length(min=5, max=5), Length(min=5, max=5))
+        self.assertIsNot(Length(min=5, max=5), Length(min=5, max=6))
+
     def test_ByteSize(self):
         with self.assertRaises(ValueError):
             v = ByteSize(max=10)
-            v.validate("test")
+            v.validate("test" * 3)
+
+        # The size of the text or bytes value is the length of its bytes.
+        ByteSize(max=4).validate("test")
+
+        with self.assertRaises(ValueError):
+            ByteSize(max=4).validate(b"12345")
+
+        # The non-ASCII text is encoded if its length can't tell the result.
+        ByteSize(max=4).validate(u"\u00e9\u00e9")
+
+        with self.assertRaises(ValueError):
+            ByteSize(max=3).validate(u"\u00e9\u00e9")
+
+        # The lone surrogate is counted as 3 bytes, but not an encoding error.
+        ByteSize(max=3).validate(u"\ud800")
+
+        with self.assertRaises(ValueError) as e:
+            ByteSize(max=2).validate(u"\ud800")
+
+        self.assertEqual(str(e.exception), "Can not greater then 2 bytes size")
 
     def test_NumberRange(self):
         with self.assertRaises(ValueError):
@@ -122,6 +300,11 @@ class TestValidator(unittest.TestCase):
             v = Regular(r"test")
             v.validate("1")
 
+        Regular("abc", flags=re.IGNORECASE).validate("ABC")
+
+        with self.assertRaises(ValueError):
+            Regular("abc").validate("ABC")
+
     def test_AnyOf(self):
         with self.assertRaises(ValueError):
             v = AnyOf(("1",))